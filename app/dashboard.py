@@ -1,28 +1,113 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
 import os
 import sys
-import json
+import orjson
+from pathlib import Path
 
 # Add parent dir to path to import src
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.data_collection import GitHubFetcher
-from src.llm_analysis import OllamaAnalyzer
+from src.llm_analysis import FALLBACK_USER_TITLE, OllamaAnalyzer
 from src.traditional_ds import TraditionalAnalyzer
 
 st.set_page_config(page_title="AI-GitHub Dashboard", layout="wide")
 
+LOCALES_DIR = Path(__file__).resolve().parent.parent / 'locales'
+
+# Styles for the replay cards and timeline. Emitted once per full run, outside the
+# tab fragments, so fragment reruns don't resend them.
+DASHBOARD_CSS = """
+<style>
+.replay-card {
+    background-color: #0d1117;
+    border: 1px solid #30363d;
+    border-radius: 10px;
+    padding: 20px;
+    text-align: center;
+    margin-bottom: 20px;
+}
+.metric-value {
+    font-size: 2em;
+    font-weight: bold;
+    color: #58a6ff;
+}
+.metric-label {
+    color: #8b949e;
+    font-size: 1em;
+}
+.persona-title {
+    font-size: 2.5em;
+    background: -webkit-linear-gradient(45deg, #FF0080, #7928CA);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    font-weight: bold;
+}
+.timeline {
+    position: relative;
+    max-width: 1200px;
+    margin: 0 auto;
+}
+.timeline::after {
+    content: '';
+    position: absolute;
+    width: 6px;
+    background-color: #30363d;
+    top: 0;
+    bottom: 0;
+    left: 31px;
+    margin-left: -3px;
+}
+.container {
+    padding: 10px 40px;
+    position: relative;
+    background-color: inherit;
+    width: 100%;
+}
+.container::after {
+    content: '';
+    position: absolute;
+    width: 25px;
+    height: 25px;
+    right: -17px;
+    background-color: #58a6ff;
+    border: 4px solid #0d1117;
+    top: 15px;
+    border-radius: 50%;
+    z-index: 1;
+    left: 18px;
+}
+.content {
+    padding: 20px 30px;
+    background-color: #161b22;
+    position: relative;
+    border-radius: 6px;
+    border: 1px solid #30363d;
+}
+.date {
+    font-size: 0.85em;
+    color: #8b949e;
+    margin-bottom: 5px;
+}
+.title {
+    font-size: 1.1em;
+    font-weight: bold;
+    color: #c9d1d9;
+}
+</style>
+"""
+st.markdown(DASHBOARD_CSS, unsafe_allow_html=True)
+
 # --- Localization Setup ---
+@st.cache_data(show_spinner=False)
 def load_translations(lang_code):
     """Loads the JSON translation file for the specified language code, falling back to English for missing keys."""
     # Load English first as base
-    base_path = os.path.join(os.path.dirname(__file__), '..', 'locales', 'en.json')
     translations = {}
     try:
-        with open(base_path, 'r', encoding='utf-8') as f:
-            translations = json.load(f)
+        translations = orjson.loads((LOCALES_DIR / 'en.json').read_bytes())
     except Exception as e:
         print(f"Error loading base translations: {e}")
 
@@ -30,11 +115,9 @@ def load_translations(lang_code):
         return translations
 
     # Load selected language and update
-    locale_path = os.path.join(os.path.dirname(__file__), '..', 'locales', f'{lang_code}.json')
     try:
-        with open(locale_path, 'r', encoding='utf-8') as f:
-            lang_data = json.load(f)
-            translations.update(lang_data)
+        lang_data = orjson.loads((LOCALES_DIR / f'{lang_code}.json').read_bytes())
+        translations.update(lang_data)
     except FileNotFoundError:
         pass # Just return English if file not found
     except Exception as e:
@@ -65,6 +148,8 @@ def t(key, **kwargs):
     text = translations.get(key, key) # Default to key if not found
     if text is None:
         return str(key)
+    if not kwargs:
+        return str(text) # Nothing to substitute, skip str.format
         
     try:
         return str(text).format(**kwargs)
@@ -73,6 +158,330 @@ def t(key, **kwargs):
 
 # --- End Localization Setup ---
 
+# --- Data Loading ---
+DATA_PATH = "data/raw_data.json"
+
+def get_data_version(data_path=DATA_PATH):
+    """Returns a token that changes whenever the cached data file is rewritten."""
+    try:
+        return os.path.getmtime(data_path)
+    except OSError:
+        return None
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_analyzer(data_version):
+    """Builds the TraditionalAnalyzer once per data file version and shares it across reruns.
+    There is a single data file, so only the latest version is kept in memory."""
+    analyzer = TraditionalAnalyzer(data_path=DATA_PATH)
+    analyzer.load_data()
+    return analyzer
+
+# Aggregations are keyed on the data version so a fresh fetch invalidates them
+@st.cache_data(show_spinner=False)
+def _basic_stats(data_version):
+    return get_analyzer(data_version).get_basic_stats()
+
+@st.cache_data(show_spinner=False)
+def _user_stats(data_version):
+    return get_analyzer(data_version).get_user_stats()
+
+@st.cache_data(show_spinner=False)
+def _timeline_events(data_version):
+    return get_analyzer(data_version).get_timeline_events()
+
+@st.cache_data(persist="disk", max_entries=16, show_spinner=False)
+def _forecast(data_version):
+    """Fits the Prophet model once per data version; exceptions are not cached.
+    Safe to persist to disk because both this cache and get_analyzer are keyed on the
+    data file mtime, so a rewritten file can never be served a forecast from older data."""
+    return get_analyzer(data_version).forecast_activity()
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _repo_index(data_version):
+    """Maps repo name to its row so the LLM tab can look repos up without scanning repos_df.
+    A shared resource rather than cache_data, so lookups don't unpickle every README; never mutate it."""
+    repos_df = get_analyzer(data_version).repos_df
+    return repos_df.set_index('name', drop=False).to_dict('index')
+
+@st.cache_data(show_spinner=False)
+def _hourly_commits(data_version):
+    """Counts commits per hour of day (UTC) with a single bincount over the raw timestamps."""
+    dates = get_analyzer(data_version).commits_df['date'].values
+    hours = dates.astype('datetime64[h]').astype(np.int64) % 24
+    return pd.Series(np.bincount(hours, minlength=24), index=range(24))
+
+GRADE_COLORS = {"A": "#2ea043", "B": "#e3b341"} # Anything lower is shown in red
+
+@st.cache_data(show_spinner=False)
+def _repo_health_table(data_version):
+    """One row per repo with its health grade, detected stack and missing files."""
+    rows = []
+    for repo in get_analyzer(data_version).repos_df.itertuples(index=False):
+        repo_data = {"details": {"files": repo.files}}
+        health = TraditionalAnalyzer.calculate_health_score(repo_data)
+        stack = TraditionalAnalyzer.detect_tech_stack(repo_data)
+        rows.append({
+            "Name": repo.name,
+            "Health": health['grade'],
+            "Stack": " ".join(stack) if stack else "No stack detected",
+            "Missing": ", ".join(health['missing'][:2])
+        })
+    return pd.DataFrame(rows)
+
+@st.cache_data(show_spinner=False)
+def _timeline_html(events):
+    """Builds the replay timeline markup from (date, icon, title) triples in one join."""
+    parts = ['<div class="timeline">']
+    parts.extend(
+        f'<div class="container"><div class="content"><div class="date">{date}</div>'
+        f'<div class="title">{icon} {title}</div></div></div>'
+        for date, icon, title in events
+    )
+    parts.append('</div>')
+    return ''.join(parts)
+
+# --- LLM Response Caching ---
+@st.cache_resource(show_spinner=False)
+def get_llm(model_name):
+    """Shares one OllamaAnalyzer (and its HTTP client) per model across reruns."""
+    return OllamaAnalyzer(model_name=model_name)
+
+class LLMCallError(Exception):
+    """Raised by the cached LLM wrappers on failure, since st.cache_data never stores exceptions."""
+    def __init__(self, result):
+        super().__init__(str(result))
+        self.result = result
+
+# Ollama calls take seconds, so identical (model, input) pairs are answered from cache.
+# Answers are persisted to disk to survive server restarts (Streamlit ignores ttl on
+# persisted caches, so max_entries bounds them instead). Failed calls raise
+# LLMCallError so only successful answers are ever cached.
+@st.cache_data(persist="disk", max_entries=256, show_spinner=False)
+def _cached_sentiment(model_name, text):
+    sentiment = get_llm(model_name).analyze_sentiment(text)
+    if sentiment == "Error":
+        raise LLMCallError("Error: Could not analyze sentiment. Is Ollama running?")
+    return sentiment
+
+@st.cache_data(persist="disk", max_entries=256, show_spinner=False)
+def _cached_skills(model_name, readme_text):
+    skills = get_llm(model_name).extract_skills(readme_text)
+    if skills.startswith("Error:"):
+        raise LLMCallError(skills)
+    return skills
+
+@st.cache_data(persist="disk", max_entries=256, show_spinner=False)
+def _cached_readme_tips(model_name, readme_text):
+    tips = get_llm(model_name).analyze_readme_quality(readme_text)
+    if tips.startswith("Error:"):
+        raise LLMCallError(tips)
+    return tips
+
+@st.cache_data(persist="disk", max_entries=256, show_spinner=False)
+def _cached_user_title(model_name, stats):
+    title = get_llm(model_name).generate_user_title(stats)
+    if title == FALLBACK_USER_TITLE:
+        raise LLMCallError("Error: Could not generate your persona. Is Ollama running?")
+    return title
+
+
+# --- Tab Fragments ---
+# Tabs with their own buttons run as fragments so a click only reruns that tab.
+@st.fragment
+def _render_llm_tab(analyzer, data_version):
+    st.subheader(t("subheader_llm"))
+    ollama_model = st.selectbox(t("select_model_label"), ["llama3.1", "mistral"], key="ollama_model")
+
+    if st.button(t("analyze_sentiment_button")):
+        if analyzer.commits_df is not None and not analyzer.commits_df.empty:
+            sample_commit = analyzer.commits_df.iloc[0]['message']
+            st.write(f"**Sample Commit:** {sample_commit}")
+            with st.spinner(t("sentiment_spinner")):
+                try:
+                    sentiment = _cached_sentiment(ollama_model, sample_commit)
+                    st.write(f"**Sentiment:** {sentiment}")
+                except LLMCallError as e:
+                    st.error(e.result)
+        else:
+            st.info(t("no_commits_info"))
+
+    st.markdown(t("skill_extraction_header"))
+    if analyzer.repos_df is not None and not analyzer.repos_df.empty:
+        repo_names = analyzer.repos_df['name'].tolist()
+        selected_repo = st.selectbox(t("select_repo_label"), repo_names, key="skill_repo")
+        
+        if st.button(t("extract_skills_button")):
+            repo_data = _repo_index(data_version)[selected_repo]
+            readme_text = repo_data.get('readme_content', "")
+            
+            if readme_text:
+                with st.spinner(t("extracting_spinner", repo=selected_repo)):
+                    try:
+                        skills = _cached_skills(ollama_model, readme_text)
+                    except LLMCallError as e:
+                        st.error(e.result)
+                        skills = None
+                    if skills:
+                        st.success(t("skills_extracted_success"))
+                        st.markdown(f"### 🛠️ Detected Skills\n{skills}")
+                    elif skills is not None:
+                        st.warning(t("skills_extraction_failed"))
+
+            else:
+                st.warning(t("no_readme_warning"))
+        
+        st.divider()
+        st.subheader("🧠 AI README Improver")
+        st.markdown("Select a repository above to analyze its README for improvements.")
+        
+        if st.button("🚀 Improve My README"):
+            repo_data = _repo_index(data_version)[selected_repo]
+            readme_text = repo_data.get('readme_content', "")
+            if readme_text:
+                with st.spinner(f"Analyzing README for {selected_repo}..."):
+                    try:
+                        tips = _cached_readme_tips(ollama_model, readme_text)
+                        st.markdown("### 📝 Improvement Checklist")
+                        st.markdown(tips)
+                    except LLMCallError as e:
+                        st.error(e.result)
+            else:
+                st.warning("No README found to improve.")
+
+    else:
+        st.info(t("clustering_info_no_data"))
+
+@st.fragment
+def _render_forecast_tab(data_version):
+    st.subheader(t("subheader_forecasting"))
+    if st.button(t("generate_forecast_button")):
+        with st.spinner(t("forecasting_spinner")):
+            try:
+                forecast = _forecast(data_version)
+                if forecast is not None:
+                    import plotly.express as px
+                    fig = px.line(forecast, x='ds', y='yhat', title=t("forecast_title"))
+                    # Add confidence intervals
+                    fig.add_scatter(x=forecast['ds'], y=forecast['yhat_lower'], mode='lines', line=dict(width=0), showlegend=False)
+                    fig.add_scatter(x=forecast['ds'], y=forecast['yhat_upper'], fill='tonexty', mode='lines', line=dict(width=0), showlegend=False)
+                    st.plotly_chart(fig)
+                else:
+                    st.warning(t("forecast_warning_not_enough"))
+            except Exception as e:
+                st.error(t("forecast_error", error=str(e)))
+
+@st.fragment
+def _render_comparison_tab():
+    st.subheader(t("subheader_comparison"))
+    prompt = st.text_area(t("test_prompt_label"), "Summarize the coding style based on these commits...")
+    if st.button(t("compare_button")):
+        with st.spinner(t("comparison_spinner")):
+            # Not cached: the point of this tab is a fresh latency measurement.
+            # compare_models queries its own list of models, so the client's model doesn't matter.
+            results = get_llm("llama3.1").compare_models(prompt)
+            for model_name, metrics in results.items():
+                st.write(f"### {model_name}")
+                if "error" in metrics:
+                    st.error(metrics["error"])
+                else:
+                    st.write(f"**Time:** {metrics['time']:.2f}s")
+                    st.write(f"**Response:** {metrics['response']}")
+                    st.divider()
+
+@st.fragment
+def _render_replay_tab(analyzer, data_version, basic_stats):
+    st.header("💻 GitHub Replay 2025")
+    
+    user_stats = _user_stats(data_version)
+    
+    # Generator Title logic
+    # Only call Ollama on request so opening the page never waits on the LLM
+    if "user_title" not in st.session_state:
+        if st.button("✨ Generate AI Persona"):
+            with st.spinner("Generating your AI Developer Persona..."):
+                ollama_model = st.session_state.get("ollama_model", "llama3.1")
+                try:
+                    st.session_state["user_title"] = _cached_user_title(ollama_model, user_stats)
+                except LLMCallError as e:
+                    st.error(e.result) # Leave user_title unset so the button stays available
+    user_title = st.session_state.get("user_title", "Click 'Generate AI Persona' to reveal yours")
+
+    # --- Persona Section ---
+    st.markdown(f"""
+    <div class="replay-card">
+        <div class="metric-label">Your AI Developer Persona</div>
+        <div class="persona-title">{user_title}</div>
+        <div style="margin-top: 10px; font-size: 1.2em;">{user_stats.get('chronotype', 'Day Walker')}</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # --- Metrics Grid ---
+    c1, c2, c3, c4 = st.columns(4)
+    with c1:
+        st.markdown(f"""
+        <div class="replay-card">
+            <div class="metric-value">{user_stats.get('total_commits', 0)}</div>
+            <div class="metric-label">Total Commits</div>
+        </div>
+        """, unsafe_allow_html=True)
+    with c2:
+        st.markdown(f"""
+        <div class="replay-card">
+            <div class="metric-value">{user_stats.get('longest_streak', 0)} Days</div>
+            <div class="metric-label">Longest Streak</div>
+        </div>
+        """, unsafe_allow_html=True)
+    with c3:
+        st.markdown(f"""
+        <div class="replay-card">
+            <div class="metric-value">{user_stats.get('top_language', 'Unknown')}</div>
+            <div class="metric-label">Top Language</div>
+        </div>
+        """, unsafe_allow_html=True)
+    with c4:
+        st.markdown(f"""
+        <div class="replay-card">
+            <div class="metric-value">{user_stats.get('most_active_month', 'Unknown')[:3]}</div>
+            <div class="metric-label">Peak Month</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.divider()
+
+    # --- Visualizations ---
+    col_viz1, col_viz2 = st.columns(2)
+    
+    with col_viz1:
+         st.subheader("🕑 Daily Activity Pattern")
+         if analyzer.commits_df is not None and not analyzer.commits_df.empty:
+             hourly_counts = _hourly_commits(data_version)
+             st.bar_chart(hourly_counts)
+         else:
+             st.info("No commit data available.")
+
+    with col_viz2:
+        st.subheader("💻 Top Languages")
+        # get_user_stats only returns the top language, the full breakdown lives in basic_stats
+        top_langs = basic_stats.get("top_languages", {})
+        if top_langs:
+            st.bar_chart(pd.Series(top_langs).head(5))
+        else:
+            st.info("No language data.")
+    
+    if st.button("Generate Replay"):
+         st.balloons()
+
+    st.divider()
+    st.subheader("🚀 My GitHub Journey")
+    
+    timeline_events = _timeline_events(data_version)
+    
+    if timeline_events:
+        timeline_html = _timeline_html(tuple((e['date'], e['icon'], e['title']) for e in timeline_events))
+        st.markdown(timeline_html, unsafe_allow_html=True)
+    else:
+        st.info("No timeline events found.")
+
 
 st.title(t("main_title"))
 
@@ -128,8 +537,9 @@ if not username:
 
 try:
     # Load Data
-    analyzer = TraditionalAnalyzer()
-    data_loaded = analyzer.load_data()
+    data_version = get_data_version()
+    analyzer = get_analyzer(data_version)
+    data_loaded = analyzer.repos_df is not None
     
     # Check if data corresponds to the current user
     if data_loaded:
@@ -143,14 +553,14 @@ try:
         st.warning(t("no_data_warning"))
         st.stop()
 
-    stats = analyzer.get_basic_stats()
+    basic_stats = _basic_stats(data_version)
 
     # Overview Section
     st.header(t("overview_header"))
     c1, c2, c3 = st.columns(3)
-    c1.metric(t("metric_total_repos"), stats.get("total_repos", 0))
-    c2.metric(t("metric_total_stars"), stats.get("total_stars", 0))
-    c3.metric(t("metric_commits_tracked"), stats.get("total_commits_tracked", 0))
+    c1.metric(t("metric_total_repos"), basic_stats.get("total_repos", 0))
+    c2.metric(t("metric_total_stars"), basic_stats.get("total_stars", 0))
+    c3.metric(t("metric_commits_tracked"), basic_stats.get("total_commits_tracked", 0))
 
     # Tabs
     tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
@@ -169,330 +579,38 @@ try:
         if analyzer.repos_df is not None and not analyzer.repos_df.empty:
             st.markdown("### 🏆 Repository Health & Tech Stack")
             
-            # Use columns for a grid layout of repo cards
-            # We'll show top 10 most recent or starred to avoid clutter, or a list
-            # Let's show a list of cards
-            
-            # Need to get the full objects to pass to helper functions
-            # Since repos_df has 'files' now (we updated load_data), we can construct it
-            repos = analyzer.repos_df.to_dict('records')
-            
-            for repo in repos:
-                 # Reconstruct repo_data structure expected by functions
-                 # Structure: {"details": {"files": [...]}}
-                 repo_data_struct = {"details": {"files": repo.get("files", [])}}
-                 
-                 health = analyzer.calculate_health_score(repo_data_struct)
-                 stack = analyzer.detect_tech_stack(repo_data_struct)
-                 
-                 # Grade Color
-                 grade_color = "#2ea043" if health['grade'] == 'A' else "#e3b341" if health['grade'] == 'B' else "#da3633"
-                 
-                 with st.container():
-                     c1, c2, c3 = st.columns([2, 1, 1])
-                     with c1:
-                         st.markdown(f"**{repo['name']}**")
-                         st.caption(f"{repo.get('description', '')}")
-                     with c2:
-                         st.markdown(f"Health: <span style='color:{grade_color}; font-weight:bold; border:1px solid {grade_color}; padding:2px 6px; border-radius:4px;'>{health['grade']}</span>", unsafe_allow_html=True)
-                         if health['missing']:
-                             st.caption(f"Missing: {', '.join(health['missing'][:2])}")
-                     with c3:
-                         if stack:
-                            st.write(" ".join([f"`{s}`" for s in stack]))
-                         else:
-                            st.caption("No stack detected")
-                     st.divider()
+            # A single Arrow-backed table instead of a set of elements per repo
+            health_table = _repo_health_table(data_version)
+            styled_table = health_table.style.map(
+                lambda grade: f"color: {GRADE_COLORS.get(grade, '#da3633')}; font-weight: bold",
+                subset=["Health"]
+            )
+            st.dataframe(styled_table, width="stretch", hide_index=True)
 
         else:
             st.info(t("clustering_info_no_data"))
 
     with tab2:
         st.subheader(t("subheader_language"))
-        langs = stats.get("top_languages", {})
+        langs = basic_stats.get("top_languages", {})
         if langs:
+            import plotly.express as px
             fig = px.pie(values=list(langs.values()), names=list(langs.keys()), title=t("language_pie_title"))
             st.plotly_chart(fig)
         else:
             st.info(t("language_info_no_data"))
 
     with tab3:
-        st.subheader(t("subheader_llm"))
-        ollama_model = st.selectbox(t("select_model_label"), ["llama3.1", "mistral"])
-        llm = OllamaAnalyzer(model_name=ollama_model)
-
-        if st.button(t("analyze_sentiment_button")):
-            if analyzer.commits_df is not None and not analyzer.commits_df.empty:
-                sample_commit = analyzer.commits_df.iloc[0]['message']
-                st.write(f"**Sample Commit:** {sample_commit}")
-                with st.spinner(t("sentiment_spinner")):
-                    sentiment = llm.analyze_sentiment(sample_commit)
-                    st.write(f"**Sentiment:** {sentiment}")
-            else:
-                st.info(t("no_commits_info"))
-
-        st.markdown(t("skill_extraction_header"))
-        if analyzer.repos_df is not None and not analyzer.repos_df.empty:
-            repo_names = analyzer.repos_df['name'].tolist()
-            selected_repo = st.selectbox(t("select_repo_label"), repo_names, key="skill_repo")
-            
-            if st.button(t("extract_skills_button")):
-                repo_data = analyzer.repos_df[analyzer.repos_df['name'] == selected_repo].iloc[0]
-                readme_text = repo_data.get('readme_content', "")
-                
-                if readme_text:
-                    with st.spinner(t("extracting_spinner", repo=selected_repo)):
-                        skills = llm.extract_skills(readme_text)
-                        if skills and skills.startswith("Error:"):
-                            st.error(skills)
-                        elif skills:
-                            st.success(t("skills_extracted_success"))
-                            st.markdown(f"### 🛠️ Detected Skills\n{skills}")
-                        else:
-                            st.warning(t("skills_extraction_failed"))
-
-                else:
-                    st.warning(t("no_readme_warning"))
-            
-            st.divider()
-            st.subheader("🧠 AI README Improver")
-            st.markdown("Select a repository above to analyze its README for improvements.")
-            
-            if st.button("🚀 Improve My README"):
-                repo_data = analyzer.repos_df[analyzer.repos_df['name'] == selected_repo].iloc[0]
-                readme_text = repo_data.get('readme_content', "")
-                if readme_text:
-                    with st.spinner(f"Analyzing README for {selected_repo}..."):
-                        tips = llm.analyze_readme_quality(readme_text)
-                        if tips.startswith("Error:"):
-                             st.error(tips)
-                        else:
-                             st.markdown("### 📝 Improvement Checklist")
-                             st.markdown(tips)
-                else:
-                    st.warning("No README found to improve.")
-
-        else:
-            st.info(t("clustering_info_no_data"))
+        _render_llm_tab(analyzer, data_version)
 
     with tab4:
-        st.subheader(t("subheader_forecasting"))
-        if st.button(t("generate_forecast_button")):
-            with st.spinner(t("forecasting_spinner")):
-                try:
-                    forecast = analyzer.forecast_activity()
-                    if forecast is not None:
-                        fig = px.line(forecast, x='ds', y='yhat', title=t("forecast_title"))
-                        # Add confidence intervals
-                        fig.add_scatter(x=forecast['ds'], y=forecast['yhat_lower'], mode='lines', line=dict(width=0), showlegend=False)
-                        fig.add_scatter(x=forecast['ds'], y=forecast['yhat_upper'], fill='tonexty', mode='lines', line=dict(width=0), showlegend=False)
-                        st.plotly_chart(fig)
-                    else:
-                        st.warning(t("forecast_warning_not_enough"))
-                except Exception as e:
-                    st.error(t("forecast_error", error=str(e)))
+        _render_forecast_tab(data_version)
 
     with tab5:
-        st.subheader(t("subheader_comparison"))
-        prompt = st.text_area(t("test_prompt_label"), "Summarize the coding style based on these commits...")
-        if st.button(t("compare_button")):
-            with st.spinner(t("comparison_spinner")):
-                results = llm.compare_models(prompt)
-                for model_name, metrics in results.items():
-                    st.write(f"### {model_name}")
-                    if "error" in metrics:
-                        st.error(metrics["error"])
-                    else:
-                        st.write(f"**Time:** {metrics['time']:.2f}s")
-                        st.write(f"**Response:** {metrics['response']}")
-                        st.divider()
+        _render_comparison_tab()
 
     with tab6:
-        st.header("💻 GitHub Replay 2025")
-        
-        user_stats = analyzer.get_user_stats()
-        
-        # Generator Title logic
-        if "user_title" not in st.session_state:
-            with st.spinner("Generating your AI Developer Persona..."):
-                llm_replay = OllamaAnalyzer(model_name=ollama_model if 'ollama_model' in locals() else "llama3.1")
-                st.session_state["user_title"] = llm_replay.generate_user_title(user_stats)
-
-        # --- Custom CSS for Cards ---
-        st.markdown("""
-        <style>
-        .replay-card {
-            background-color: #0d1117;
-            border: 1px solid #30363d;
-            border-radius: 10px;
-            padding: 20px;
-            text-align: center;
-            margin-bottom: 20px;
-        }
-        .metric-value {
-            font-size: 2em;
-            font-weight: bold;
-            color: #58a6ff;
-        }
-        .metric-label {
-            color: #8b949e;
-            font-size: 1em;
-        }
-        .persona-title {
-            font-size: 2.5em;
-            background: -webkit-linear-gradient(45deg, #FF0080, #7928CA);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            font-weight: bold;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # --- Persona Section ---
-        st.markdown(f"""
-        <div class="replay-card">
-            <div class="metric-label">Your AI Developer Persona</div>
-            <div class="persona-title">{st.session_state['user_title']}</div>
-            <div style="margin-top: 10px; font-size: 1.2em;">{user_stats.get('chronotype', 'Day Walker')}</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # --- Metrics Grid ---
-        c1, c2, c3, c4 = st.columns(4)
-        with c1:
-            st.markdown(f"""
-            <div class="replay-card">
-                <div class="metric-value">{user_stats.get('total_commits', 0)}</div>
-                <div class="metric-label">Total Commits</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with c2:
-            st.markdown(f"""
-            <div class="replay-card">
-                <div class="metric-value">{user_stats.get('longest_streak', 0)} Days</div>
-                <div class="metric-label">Longest Streak</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with c3:
-            st.markdown(f"""
-            <div class="replay-card">
-                <div class="metric-value">{user_stats.get('top_language', 'Unknown')}</div>
-                <div class="metric-label">Top Language</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with c4:
-            st.markdown(f"""
-            <div class="replay-card">
-                <div class="metric-value">{user_stats.get('most_active_month', 'Unknown')[:3]}</div>
-                <div class="metric-label">Peak Month</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        st.divider()
-
-        # --- Visualizations ---
-        col_viz1, col_viz2 = st.columns(2)
-        
-        with col_viz1:
-             st.subheader("🕑 Daily Activity Pattern")
-             if analyzer.commits_df is not None and not analyzer.commits_df.empty:
-                 hourly_counts = analyzer.commits_df['date'].dt.hour.value_counts().sort_index()
-                 st.bar_chart(hourly_counts)
-             else:
-                 st.info("No commit data available.")
-
-        with col_viz2:
-            st.subheader("💻 Top Languages")
-            langs = user_stats.get("top_languages", {}) # Note: get_user_stats currently doesn't return full dict, need to fix or use analyzer.get_basic_stats
-            # Actually get_basic_stats has it.
-            basic_stats = analyzer.get_basic_stats()
-            top_langs = basic_stats.get("top_languages", {})
-            if top_langs:
-                st.bar_chart(pd.Series(top_langs).head(5))
-            else:
-                st.info("No language data.")
-        
-        if st.button("Generate Replay"):
-             st.balloons()
-
-        st.divider()
-        st.subheader("🚀 My GitHub Journey")
-        
-        timeline_events = analyzer.get_timeline_events()
-        
-        if timeline_events:
-            # Custom HTML for Timeline
-            timeline_html = """
-            <style>
-            .timeline {
-                position: relative;
-                max-width: 1200px;
-                margin: 0 auto;
-            }
-            .timeline::after {
-                content: '';
-                position: absolute;
-                width: 6px;
-                background-color: #30363d;
-                top: 0;
-                bottom: 0;
-                left: 31px;
-                margin-left: -3px;
-            }
-            .container {
-                padding: 10px 40px;
-                position: relative;
-                background-color: inherit;
-                width: 100%;
-            }
-            .container::after {
-                content: '';
-                position: absolute;
-                width: 25px;
-                height: 25px;
-                right: -17px;
-                background-color: #58a6ff;
-                border: 4px solid #0d1117;
-                top: 15px;
-                border-radius: 50%;
-                z-index: 1;
-                left: 18px;
-            }
-            .content {
-                padding: 20px 30px;
-                background-color: #161b22;
-                position: relative;
-                border-radius: 6px;
-                border: 1px solid #30363d;
-            }
-            .date {
-                font-size: 0.85em;
-                color: #8b949e;
-                margin-bottom: 5px;
-            }
-            .title {
-                font-size: 1.1em;
-                font-weight: bold;
-                color: #c9d1d9;
-            }
-            </style>
-            <div class="timeline">
-            """
-            
-            for event in timeline_events:
-                timeline_html += f"""
-                <div class="container">
-                    <div class="content">
-                        <div class="date">{event['date']}</div>
-                        <div class="title">{event['icon']} {event['title']}</div>
-                    </div>
-                </div>
-                """
-            
-            timeline_html += "</div>"
-            st.markdown(timeline_html, unsafe_allow_html=True)
-        else:
-            st.info("No timeline events found.")
+        _render_replay_tab(analyzer, data_version, basic_stats)
 
 except Exception as e:
     st.error(t("error_occurred", error=str(e)))
@@ -1,6 +1,6 @@
 import os
 import requests
-import json
+import orjson
 import time
 from datetime import datetime
 from dotenv import load_dotenv
@@ -157,8 +157,8 @@ class GitHubFetcher:
 
     def save_data(self, data, filename="data/raw_data.json"):
         os.makedirs("data", exist_ok=True)
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         print(f"Data saved to {filename}")
 
 if __name__ == "__main__":
@@ -2,10 +2,12 @@ import ollama
 import os
 from dotenv import load_dotenv
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 load_dotenv()
 
 OLLAMA_HOST = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+FALLBACK_USER_TITLE = "The GitHub Wanderer" # Returned by generate_user_title when Ollama fails
 
 class OllamaAnalyzer:
     def __init__(self, model_name="llama3.1"):
@@ -47,22 +49,27 @@ class OllamaAnalyzer:
             print(f"Error in topic classification: {e}")
             return "Other"
 
+    def _call_model(self, model, task_prompt):
+        start_time = time.time()
+        try:
+            response = self.client.chat(model=model, messages=[
+                {'role': 'user', 'content': task_prompt}
+            ])
+            duration = time.time() - start_time
+            return {
+                "response": response['message']['content'],
+                "time": duration
+            }
+        except Exception as e:
+            return {"error": str(e)}
+
     def compare_models(self, task_prompt, models=["llama3.1", "mistral"]):
-        results = {}
-        for model in models:
-            start_time = time.time()
-            try:
-                response = self.client.chat(model=model, messages=[
-                    {'role': 'user', 'content': task_prompt}
-                ])
-                duration = time.time() - start_time
-                results[model] = {
-                    "response": response['message']['content'],
-                    "time": duration
-                }
-            except Exception as e:
-                results[model] = {"error": str(e)}
-        return results
+        if not models:
+            return {}
+        # Each call is I/O bound against Ollama, so query the models concurrently
+        with ThreadPoolExecutor(max_workers=len(models)) as executor:
+            futures = {model: executor.submit(self._call_model, model, task_prompt) for model in models}
+            return {model: future.result() for model, future in futures.items()}
 
     def generate_user_title(self, stats):
         prompt = f"""Based on the following GitHub stats, generate a creative, fun, RPG-style user title (max 5 words).
@@ -79,7 +86,7 @@ class OllamaAnalyzer:
             return response['message']['content'].strip().replace('"', '')
         except Exception as e:
             print(f"Error generating title: {e}")
-            return "The GitHub Wanderer"
+            return FALLBACK_USER_TITLE
 
     def analyze_readme_quality(self, readme_content):
         prompt = f"""Analyze the quality of this README file.
@@ -1,11 +1,6 @@
 import pandas as pd
 import numpy as np
-import json
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
-from prophet import Prophet
-import plotly.express as px
-import plotly.graph_objects as go
+import orjson
 import os
 
 class TraditionalAnalyzer:
@@ -20,8 +15,8 @@ class TraditionalAnalyzer:
             print(f"Data file not found at {self.data_path}")
             return False
 
-        with open(self.data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(self.data_path, 'rb') as f:
+            data = orjson.loads(f.read())
 
         self.profile_data = data.get("profile", {})
         repos = data.get("repositories", [])
@@ -57,13 +52,16 @@ class TraditionalAnalyzer:
                     if author_date:
                         all_commits.append({
                             "repo_name": repo_meta.get("name"),
-                            "date": pd.to_datetime(author_date),
+                            "date": author_date,
                             "message": c_meta.get("message"),
                             "author": c_meta.get("author", {}).get("name")
                         })
 
         self.repos_df = pd.DataFrame(repo_list)
         self.commits_df = pd.DataFrame(all_commits)
+        if not self.commits_df.empty:
+            # Parse all commit dates in one vectorized pass instead of one call per commit
+            self.commits_df['date'] = pd.to_datetime(self.commits_df['date'], format='ISO8601', utc=True, cache=True)
         print("Data loaded successfully.")
         return True
 
@@ -80,6 +78,9 @@ class TraditionalAnalyzer:
         if self.repos_df is None or self.repos_df.empty:
             return None
         
+        from sklearn.cluster import KMeans
+        from sklearn.preprocessing import StandardScaler
+
         # Features for clustering: stars, forks, size, readme_length
         features = self.repos_df[['stars', 'forks', 'size', 'readme_length']].fillna(0)
         
@@ -156,7 +157,8 @@ class TraditionalAnalyzer:
 
         return stats
 
-    def calculate_health_score(self, repo_data):
+    @staticmethod
+    def calculate_health_score(repo_data):
         files = repo_data.get("details", {}).get("files", [])
         score = 0
         missing = []
@@ -182,7 +184,8 @@ class TraditionalAnalyzer:
         
         return {"grade": grade, "missing": missing, "score": score}
 
-    def detect_tech_stack(self, repo_data):
+    @staticmethod
+    def detect_tech_stack(repo_data):
         files = repo_data.get("details", {}).get("files", [])
         stack = []
         
@@ -249,6 +252,7 @@ class TraditionalAnalyzer:
         if len(daily_counts) < 2:
             return None
 
+        from prophet import Prophet # Heavy import, only paid when a forecast is requested
         m = Prophet(yearly_seasonality=True)
         m.fit(daily_counts)
         
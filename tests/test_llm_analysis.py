@@ -0,0 +1,39 @@
+import threading
+import unittest
+from unittest.mock import patch
+from src.llm_analysis import OllamaAnalyzer
+
+class TestOllamaAnalyzer(unittest.TestCase):
+    @patch('src.llm_analysis.ollama.Client')
+    def test_compare_models_returns_result_per_model(self, mock_client_cls):
+        def fake_chat(model, messages):
+            if model == "mistral":
+                raise ConnectionError("connection refused")
+            return {"message": {"content": f"{model} says hi"}}
+        mock_client_cls.return_value.chat.side_effect = fake_chat
+
+        analyzer = OllamaAnalyzer()
+        results = analyzer.compare_models("Hello", models=["llama3.1", "mistral"])
+
+        self.assertEqual(list(results.keys()), ["llama3.1", "mistral"])
+        self.assertEqual(results["llama3.1"]["response"], "llama3.1 says hi")
+        self.assertIn("time", results["llama3.1"])
+        self.assertEqual(results["mistral"], {"error": "connection refused"})
+
+    @patch('src.llm_analysis.ollama.Client')
+    def test_compare_models_queries_models_concurrently(self, mock_client_cls):
+        # Each call waits until the other is also in flight, which only happens if they run concurrently
+        barrier = threading.Barrier(2, timeout=5)
+        def fake_chat(model, messages):
+            barrier.wait()
+            return {"message": {"content": model}}
+        mock_client_cls.return_value.chat.side_effect = fake_chat
+
+        analyzer = OllamaAnalyzer()
+        results = analyzer.compare_models("Hello", models=["llama3.1", "mistral"])
+
+        self.assertEqual(results["llama3.1"]["response"], "llama3.1")
+        self.assertEqual(results["mistral"]["response"], "mistral")
+
+if __name__ == '__main__':
+    unittest.main()
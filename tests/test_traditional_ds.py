@@ -0,0 +1,62 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+import pandas as pd
+from src.traditional_ds import TraditionalAnalyzer
+
+def make_commit(date):
+    return {"commit": {"author": {"date": date, "name": "Test User"}, "message": "Update"}}
+
+class TestTraditionalAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data_path = os.path.join(self.tmp_dir.name, "raw_data.json")
+        data = {
+            "profile": {"login": "testuser"},
+            "repositories": [{
+                "metadata": {"name": "repo1", "created_at": "2024-01-01T00:00:00Z", "updated_at": "2024-01-05T00:00:00Z"},
+                "details": {
+                    "readme": "# repo1",
+                    "files": ["README.md"],
+                    "recent_commits": [
+                        make_commit("2024-01-01T10:00:00Z"),
+                        make_commit("2024-01-02T12:30:00+02:00"), # 10:30 UTC
+                        make_commit("2024-01-03T23:15:30.500Z")
+                    ]
+                }
+            }]
+        }
+        with open(self.data_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    @patch('builtins.print')
+    def test_load_data_parses_commit_dates_as_utc(self, mock_print):
+        analyzer = TraditionalAnalyzer(data_path=self.data_path)
+        self.assertTrue(analyzer.load_data())
+
+        dates = analyzer.commits_df['date']
+        self.assertIsInstance(dates.dtype, pd.DatetimeTZDtype)
+        self.assertEqual(str(dates.dt.tz), "UTC")
+        self.assertEqual(dates.dt.hour.tolist(), [10, 10, 23])
+
+    def test_calculate_health_score(self):
+        repo_data = {"details": {"files": ["readme.md", "LICENSE", ".gitignore"]}}
+        health = TraditionalAnalyzer.calculate_health_score(repo_data)
+
+        self.assertEqual(health["grade"], "B")
+        self.assertEqual(health["score"], 3)
+        self.assertEqual(health["missing"], ["Contributing Guide"])
+
+    def test_detect_tech_stack(self):
+        repo_data = {"details": {"files": ["pyproject.toml", "Dockerfile", "README.md"]}}
+        stack = TraditionalAnalyzer.detect_tech_stack(repo_data)
+
+        self.assertEqual(stack, ["Python", "Docker"])
+
+if __name__ == '__main__':
+    unittest.main()